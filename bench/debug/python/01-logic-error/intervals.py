@@ -1,6 +1,8 @@
 class Interval:
     """Represents a time interval [start, end)."""
 
+    __slots__ = ("start", "end")
+
     def __init__(self, start, end):
         if start >= end:
             raise ValueError(
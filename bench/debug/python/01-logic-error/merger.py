@@ -1,41 +1,36 @@
-from intervals import Interval
+from operator import attrgetter
 
-
-def overlaps(a, b):
-    """Check if two intervals overlap.
-
-    Two intervals [a.start, a.end) and [b.start, b.end) overlap when
-    each one starts before the other ends.
-    """
-    return a.start < b.end and b.start < a.end
+# Sort key matching Interval.__lt__ (start, then end), evaluated in C.
+# The end tie-break is kept so that grouping does not depend on the
+# input order of intervals that share a start.
+_bounds = attrgetter("start", "end")
 
 
 class GroupTracker:
     """Track a group of overlapping intervals.
 
     Intervals are added in sorted order (by start time).  The tracker
-    exposes a ``span`` property that returns the bounding envelope of
-    the entire group, used to test whether the next interval overlaps.
+    keeps the bounding envelope of the entire group as the plain floats
+    ``group_start`` and ``group_end``, used to test whether the next
+    interval overlaps.
     """
 
     def __init__(self, first_interval):
         self.intervals = [first_interval]
-
-    @property
-    def span(self):
-        """Return an interval covering the full extent of this group.
-
-        Because intervals are added in sorted order, the first interval
-        has the earliest start and the last interval has the latest end.
-        """
-        return Interval(self.intervals[0].start, self.intervals[-1].end)
+        self.group_start = first_interval.start
+        self.group_end = first_interval.end
 
     def add(self, interval):
         self.intervals.append(interval)
+        # Because intervals are added in sorted order, the first interval
+        # has the earliest start and the last interval has the latest end.
+        self.group_end = interval.end
 
     def reset(self, interval):
         finished = list(self.intervals)
         self.intervals = [interval]
+        self.group_start = interval.start
+        self.group_end = interval.end
         return finished
 
 
@@ -44,12 +39,14 @@ def merge_intervals(intervals):
     if not intervals:
         return []
 
-    sorted_intervals = sorted(intervals)
+    sorted_intervals = sorted(intervals, key=_bounds)
     tracker = GroupTracker(sorted_intervals[0])
     groups = []
 
     for iv in sorted_intervals[1:]:
-        if overlaps(tracker.span, iv):
+        # [group_start, group_end) and [iv.start, iv.end) overlap when
+        # each one starts before the other ends.
+        if iv.start < tracker.group_end and tracker.group_start < iv.end:
             tracker.add(iv)
         else:
             groups.append(tracker.reset(iv))
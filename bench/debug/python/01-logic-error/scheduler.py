@@ -1,6 +1,26 @@
 from merger import merge_intervals
 
 
+def peak_concurrent(starts, ends):
+    """Return the peak number of simultaneous [start, end) intervals.
+
+    ``starts`` and ``ends`` must each be sorted ascending.  For each start,
+    the end pointer is advanced past every end at or before it -- so a
+    room freed at time T is available for a meeting starting at time T
+    -- and the meetings in progress are the starts seen minus the ends
+    passed.
+    """
+    j = 0
+    peak = 0
+    for i, start in enumerate(starts, 1):
+        while ends[j] <= start:
+            j += 1
+        if i - j > peak:
+            peak = i - j
+
+    return peak
+
+
 def find_max_concurrent(intervals):
     """Determine the minimum number of rooms needed for all meetings.
 
@@ -18,25 +38,13 @@ def find_max_concurrent(intervals):
 
     groups = merge_intervals(intervals)
 
+    # The merger hands back each group in start order, so only the end
+    # times need sorting.
     total_rooms = 0
     for group in groups:
-        # Build a list of start/end events
-        events = []
-        for iv in group:
-            events.append((iv.start, 1))    # meeting starts
-            events.append((iv.end, -1))     # meeting ends
-
-        # Sort by time; at the same time, process ends (-1) before
-        # starts (+1) so that a room freed at time T is available for
-        # a meeting starting at time T.
-        events.sort(key=lambda e: (e[0], e[1]))
-
-        concurrent = 0
-        peak = 0
-        for _time, delta in events:
-            concurrent += delta
-            peak = max(peak, concurrent)
-
-        total_rooms += peak
+        total_rooms += peak_concurrent(
+            [iv.start for iv in group],
+            sorted(iv.end for iv in group),
+        )
 
     return total_rooms
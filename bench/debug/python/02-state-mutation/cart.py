@@ -1,20 +1,22 @@
 class CartItem:
     """A single line item in the shopping cart."""
 
+    __slots__ = ("product", "quantity")
+
     def __init__(self, product, quantity):
         self.product = product
         self.quantity = quantity
 
     @property
-    def subtotal(self):
-        return self.product.price * self.quantity
+    def subtotal_cents(self):
+        return self.product.price_cents * self.quantity
 
     def __repr__(self):
         return f"CartItem({self.product.name} x{self.quantity})"
 
     def __lt__(self, other):
         """Sort by subtotal descending (highest-value items first)."""
-        return self.subtotal > other.subtotal
+        return self.subtotal_cents > other.subtotal_cents
 
 
 class Cart:
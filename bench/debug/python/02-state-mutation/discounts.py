@@ -7,7 +7,8 @@ def apply_tiered_discounts(items):
         Tier 2                  : 10% off
         Tier 3+                 :  5% off
 
-    Returns a dict mapping product name -> discounted line-item total.
+    Returns a dict mapping product name -> discounted line-item total
+    in integer cents, rounded half up to the nearest cent.
 
     """
     items.sort()
@@ -15,14 +16,14 @@ def apply_tiered_discounts(items):
     discounted_prices = {}
     for i, item in enumerate(items):
         if i == 0:
-            discount = 0.15     # tier 1
+            discount = 15       # tier 1 (percent)
         elif i == 1:
-            discount = 0.10     # tier 2
+            discount = 10       # tier 2
         else:
-            discount = 0.05     # tier 3+
+            discount = 5        # tier 3+
 
-        discounted_prices[item.product.name] = round(
-            item.subtotal * (1 - discount), 2
-        )
+        discounted_prices[item.product.name] = (
+            item.subtotal_cents * (100 - discount) + 50
+        ) // 100
 
     return discounted_prices
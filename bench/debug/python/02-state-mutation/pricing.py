@@ -1,39 +1,43 @@
 """Order pricing: combines discount calculation with shipping."""
 
+from discounts import apply_tiered_discounts
+
 # Shipping methods assigned to cart positions.  The method for item at
 # position i is  SHIPPING_METHODS[i % len(SHIPPING_METHODS)].
 SHIPPING_METHODS = ["priority", "free", "economy", "economy"]
 
+# Per-unit shipping rates in integer cents.
 SHIPPING_RATES = {
-    "priority": 8.00,
-    "free": 0.00,
-    "economy": 3.00,
+    "priority": 800,
+    "free": 0,
+    "economy": 300,
 }
 
+# Rate for each position in the shipping cycle, resolved once.
+_RATE_CYCLE = tuple(SHIPPING_RATES[m] for m in SHIPPING_METHODS)
+
 
 def calculate_shipping(items):
-    """Calculate total shipping cost.
+    """Calculate total shipping cost in cents.
 
     Each item is matched to a shipping method by its *position* in the
     list.  The rate is multiplied by the item's quantity.
     """
-    total_shipping = 0.0
+    total_shipping = 0
     for i, item in enumerate(items):
-        method = SHIPPING_METHODS[i % len(SHIPPING_METHODS)]
-        rate = SHIPPING_RATES[method]
-        total_shipping += rate * item.quantity
+        total_shipping += _RATE_CYCLE[i % len(_RATE_CYCLE)] * item.quantity
     return total_shipping
 
 
 def calculate_order_total(items):
     """Calculate the full order total (discounted items + shipping).
 
+    All amounts are summed in integer cents; the total is converted to
+    dollars only once, on return.
     """
-    from discounts import apply_tiered_discounts
-
     discounted = apply_tiered_discounts(items)
 
     item_total = sum(discounted.values())
     shipping_total = calculate_shipping(items)
 
-    return round(item_total + shipping_total, 2)
+    return (item_total + shipping_total) / 100
@@ -1,9 +1,12 @@
 class Product:
     """A product available in the store."""
 
+    __slots__ = ("name", "price", "price_cents", "weight")
+
     def __init__(self, name, price, weight):
         self.name = name
         self.price = price      # unit price in dollars
+        self.price_cents = round(price * 100)   # unit price in cents
         self.weight = weight    # weight in kg (used for shipping)
 
     def __repr__(self):
@@ -1,7 +1,5 @@
 """Recursive dictionary merger for layered configuration."""
 
-import copy
-
 
 def deep_merge(base, overlay):
     """Recursively merge *overlay* into *base* and return a new dict.
@@ -13,8 +11,12 @@ def deep_merge(base, overlay):
     * If ``overlay[key]`` is ``None``, special handling applies.
     * Otherwise, ``overlay[key]`` overwrites ``base[key]``.
 
+    Only the dicts along the overlay's keys are copied; untouched
+    sub-dicts and leaf values are shared with *base*.  Callers that
+    need an independent result should deep-copy *base* once up front.
+
     """
-    result = copy.deepcopy(base)
+    result = dict(base)
 
     for key, value in overlay.items():
         if (
@@ -1,15 +1,21 @@
 """Configuration validator -- checks invariants and counts settings."""
 
 
-def count_leaf_settings(config, prefix=""):
-    """Recursively count all leaf (non-dict) values in *config*."""
+def count_leaf_settings(config):
+    """Count all leaf (non-dict) values in *config*.
+
+    Nested sections are walked with an explicit stack rather than by
+    recursion.
+    """
     count = 0
-    for key, value in config.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if isinstance(value, dict):
-            count += count_leaf_settings(value, full_key)
-        else:
-            count += 1
+    stack = [config]
+    while stack:
+        section = stack.pop()
+        for value in section.values():
+            if isinstance(value, dict):
+                stack.append(value)
+            else:
+                count += 1
     return count
 
 
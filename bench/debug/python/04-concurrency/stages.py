@@ -1,5 +1,8 @@
 import time
-from queue import Full
+from queue import Empty, Full
+
+# Items per list handed from Stage 2 to Stage 3.
+BATCH_SIZE = 32
 
 
 class Stage1:
@@ -15,8 +18,11 @@ class Stage1:
             item = {"id": i, "value": i * 10, "adjustments": []}
 
             # Check for feedback from Stage 2
-            while not self.queue_mgr.feedback.empty():
-                fb = self.queue_mgr.feedback.get()
+            while True:
+                try:
+                    fb = self.queue_mgr.feedback.get_nowait()
+                except Empty:
+                    break
                 self.feedback_count += 1
                 # Apply feedback adjustment to future items
                 item["adjustments"].append(fb)
@@ -36,6 +42,7 @@ class Stage2:
         self.processed = 0
 
     def run(self):
+        batch = []
         while True:
             item = self.queue_mgr.stage1_to_stage2.get()
             if item is None:
@@ -54,15 +61,20 @@ class Stage2:
             }
             self.queue_mgr.feedback.put(feedback)
 
-            # Forward to Stage 3
-            self.queue_mgr.stage2_to_stage3.put(item)
+            # Forward to Stage 3 in batches
+            batch.append(item)
+            if len(batch) == BATCH_SIZE:
+                self.queue_mgr.stage2_to_stage3.put(batch)
+                batch = []
 
+        if batch:
+            self.queue_mgr.stage2_to_stage3.put(batch)
         self.queue_mgr.done_processing = True
         self.queue_mgr.stage2_to_stage3.put(None)
 
 
 class Stage3:
-    """Consumer stage. Collects processed items."""
+    """Consumer stage. Collects processed items, received in batches."""
 
     def __init__(self, queue_mgr):
         self.queue_mgr = queue_mgr
@@ -70,7 +82,7 @@ class Stage3:
 
     def run(self):
         while True:
-            item = self.queue_mgr.stage2_to_stage3.get()
-            if item is None:
+            batch = self.queue_mgr.stage2_to_stage3.get()
+            if batch is None:
                 break
-            self.results.append(item)
+            self.results.extend(batch)
@@ -1,6 +1,20 @@
+from operator import mul
+
 from stats import mean, std_dev
 
 
+def column_moments(values):
+    """Return ``(deviations, sum of squared differences)`` for one column.
+
+    The deviations are taken from the column mean, and the squared
+    differences are summed over them rather than derived from raw
+    moments, which would lose precision for values far from zero.
+    """
+    m = mean(values)
+    deviations = [v - m for v in values]
+    return deviations, sum(map(mul, deviations, deviations))
+
+
 class CorrelationCalculator:
     """Computes Pearson correlation matrix."""
 
@@ -9,24 +23,26 @@ class CorrelationCalculator:
         self.sum_sq_diff_x = 0.0
         self.sum_sq_diff_y = 0.0
 
-    def pearson(self, x_values, y_values):
+    def pearson(self, x_values, y_values, x_moments=None, y_moments=None):
         """Calculate Pearson correlation coefficient between two variables.
 
         Uses manual accumulation of sum of squared differences and
-        cross-products to compute the correlation.
-        """
-        n = len(x_values)
-        x_mean = mean(x_values)
-        y_mean = mean(y_values)
+        cross-products to compute the correlation.  Both are summed
+        with ``map(mul, ...)`` over deviations from the column means.
 
-        self.sum_products = 0.0
+        ``x_moments`` / ``y_moments`` may be passed in from
+        :func:`column_moments` when the caller has already computed them.
+        """
+        if x_moments is None:
+            x_moments = column_moments(x_values)
+        if y_moments is None:
+            y_moments = column_moments(y_values)
+        dx, sq_diff_x = x_moments
+        dy, sq_diff_y = y_moments
 
-        for i in range(n):
-            dx = x_values[i] - x_mean
-            dy = y_values[i] - y_mean
-            self.sum_products += dx * dy
-            self.sum_sq_diff_x += dx * dx
-            self.sum_sq_diff_y += dy * dy
+        self.sum_products = sum(map(mul, dx, dy))
+        self.sum_sq_diff_x += sq_diff_x
+        self.sum_sq_diff_y += sq_diff_y
 
         denominator = (self.sum_sq_diff_x * self.sum_sq_diff_y) ** 0.5
         if denominator == 0:
@@ -35,19 +51,22 @@ class CorrelationCalculator:
         return self.sum_products / denominator
 
     def correlation_matrix(self, dataset):
-        """Compute full correlation matrix for a dataset."""
+        """Compute full correlation matrix for a dataset.
+
+        Each column is extracted and centered once; only the centered
+        cross-products are computed per pair.
+        """
         n_cols = dataset.num_columns()
         matrix = [[0.0] * n_cols for _ in range(n_cols)]
 
         columns = [dataset.get_column(name) for name in dataset.columns]
+        moments = [column_moments(column) for column in columns]
 
         for i in range(n_cols):
-            for j in range(n_cols):
-                if i == j:
-                    matrix[i][j] = 1.000
-                elif j > i:
-                    r = self.pearson(columns[i], columns[j])
-                    matrix[i][j] = r
-                    matrix[j][i] = r
+            matrix[i][i] = 1.000
+            for j in range(i + 1, n_cols):
+                r = self.pearson(columns[i], columns[j], moments[i], moments[j])
+                matrix[i][j] = r
+                matrix[j][i] = r
 
         return matrix
@@ -9,6 +9,10 @@ class Dataset:
         self.columns = columns
         self.data = data
         self._validate()
+        # Column-major copy of the data, so column access needs no row scan
+        self._columns = {
+            name: tuple(row[idx] for row in data) for idx, name in enumerate(columns)
+        }
 
     def _validate(self):
         for i, row in enumerate(self.data):
@@ -18,9 +22,15 @@ class Dataset:
                 )
 
     def get_column(self, name):
-        """Get all values for a column by name."""
-        idx = self.columns.index(name)
-        return [row[idx] for row in self.data]
+        """Get all values for a column by name.
+
+        Returns the stored column as a read-only tuple.  Raises
+        ValueError for an unknown column name.
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise ValueError(f"{name!r} is not in list") from None
 
     def num_columns(self):
         return len(self.columns)
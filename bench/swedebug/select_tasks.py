@@ -11,15 +11,23 @@ tasks that are debugger-friendly:
 
 Usage:
     pip install datasets  # one-time
+    pip install orjson    # optional, faster JSON encode/decode
     python3 bench/swedebug/select_tasks.py
+    python3 bench/swedebug/select_tasks.py --include-patches
 
 Output: prints candidate tasks for manual review, sorted by patch size.
-Pick 5 and add them to tasks.json.
+Pick 5 and add them to tasks.json.  The candidates are also written to
+bench/swedebug/candidates.jsonl, one JSON object per line.  It holds only
+candidate metadata unless --include-patches is given, in which case it
+also holds the patch, test patch, problem statement and hints.
 """
 
+import argparse
 import json
 import re
 import sys
+from itertools import islice
+from typing import Optional
 
 try:
     from datasets import load_dataset
@@ -28,12 +36,19 @@ except ImportError:
     print("  pip install datasets")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
 # Repos with good Docker support and well-understood test infrastructure
-TARGET_REPOS = {
+TARGET_REPOS = frozenset({
     "django/django",
     "sympy/sympy",
     "scikit-learn/scikit-learn",
-}
+})
 
 # Python version defaults by repo (can be overridden per task)
 REPO_PYTHON = {
@@ -42,85 +57,131 @@ REPO_PYTHON = {
     "scikit-learn/scikit-learn": "3.9",
 }
 
+# Candidate fields written to candidates.jsonl without --include-patches
+SUMMARY_FIELDS = (
+    "instance_id",
+    "repo",
+    "base_commit",
+    "environment_setup_commit",
+    "python_version",
+    "changed_file",
+    "patch_size",
+    "problem_words",
+    "fail_to_pass",
+    "pass_to_pass",
+)
+
+# Patterns applied to every candidate row, compiled once
+_CHANGED_FILE_RE = re.compile(r"^diff --git a/(.+?) b/", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+
+# Minimum problem statement length, in words
+MIN_PROBLEM_WORDS = 40
+
 
 def count_diff_blocks(patch: str) -> int:
-    """Count the number of diff --git blocks in a patch."""
-    return len(re.findall(r"^diff --git ", patch, re.MULTILINE))
+    """Count the number of diff --git blocks in a patch.
+
+    Equivalent to counting ``^diff --git `` matches under re.MULTILINE,
+    but without building a match list.
+    """
+    return patch.count("\ndiff --git ") + patch.startswith("diff --git ")
 
 
-def word_count(text: str) -> int:
-    return len(text.split())
+def word_count(text: str, limit: Optional[int] = None) -> int:
+    """Count whitespace-separated words without building a list of them.
+
+    With *limit*, scanning stops once that many words have been seen, so
+    a threshold check only reads as far into *text* as it needs to.
+    """
+    return sum(1 for _ in islice(_WORD_RE.finditer(text), limit))
 
 
 def extract_changed_file(patch: str) -> str:
     """Extract the single changed file path from a 1-file patch."""
-    m = re.search(r"^diff --git a/(.+?) b/", patch, re.MULTILINE)
+    m = _CHANGED_FILE_RE.search(patch)
     return m.group(1) if m else ""
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Select SWE-bench Verified debugger tasks")
+    parser.add_argument(
+        "--include-patches", action="store_true",
+        help="Write patch, test patch, problem and hints text to candidates.jsonl",
+    )
+    args = parser.parse_args()
+
     print("Loading SWE-bench Verified dataset...", file=sys.stderr)
-    ds = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
-    print(f"Total entries: {len(ds)}", file=sys.stderr)
+    # Stream rows as they download instead of fetching and caching the
+    # whole dataset first; most rows are rejected on sight anyway.
+    ds = load_dataset("princeton-nlp/SWE-bench_Verified", split="test", streaming=True)
+
+    # Bind module globals used in the row loop to locals
+    target_repos = TARGET_REPOS
+    repo_python = REPO_PYTHON
+    count_blocks = count_diff_blocks
 
+    total = 0
     candidates = []
     for row in ds:
+        total += 1
         repo = row["repo"]
-        if repo not in TARGET_REPOS:
+        if repo not in target_repos:
             continue
 
-        patch = row.get("patch", "")
-        problem = row.get("problem_statement", "")
-
-        # Single-file patch
-        if count_diff_blocks(patch) != 1:
-            continue
+        # SWE-bench Verified has a fixed schema: every field is present and
+        # the test lists are JSON-encoded strings, so index directly.
+        patch = row["patch"]
+        problem = row["problem_statement"]
 
+        # Cheapest checks first, so rejected rows never reach the regex
+        # scan or the JSON decode below.
+        #
         # Small patch
         if len(patch) > 2000:
             continue
 
         # Clear problem statement
-        if word_count(problem) < 40:
+        if word_count(problem, MIN_PROBLEM_WORDS) < MIN_PROBLEM_WORDS:
             continue
 
-        # Must have FAIL_TO_PASS tests
-        fail_to_pass = row.get("FAIL_TO_PASS", "")
-        if isinstance(fail_to_pass, str):
-            try:
-                fail_to_pass = json.loads(fail_to_pass)
-            except (json.JSONDecodeError, TypeError):
-                fail_to_pass = [fail_to_pass] if fail_to_pass else []
+        # Must have FAIL_TO_PASS tests; an empty list is rejected on its
+        # raw "[]" encoding without decoding it
+        fail_to_pass_raw = row["FAIL_TO_PASS"]
+        if not fail_to_pass_raw or fail_to_pass_raw == "[]":
+            continue
 
-        if not fail_to_pass:
+        # Single-file patch
+        if count_blocks(patch) != 1:
             continue
 
-        pass_to_pass = row.get("PASS_TO_PASS", "")
-        if isinstance(pass_to_pass, str):
-            try:
-                pass_to_pass = json.loads(pass_to_pass)
-            except (json.JSONDecodeError, TypeError):
-                pass_to_pass = [pass_to_pass] if pass_to_pass else []
+        # Decode FAIL_TO_PASS only for rows that pass every filter
+        fail_to_pass = json_loads(fail_to_pass_raw)
+        pass_to_pass = json_loads(row["PASS_TO_PASS"])
 
-        test_patch = row.get("test_patch", "")
+        test_patch = row["test_patch"]
         changed_file = extract_changed_file(patch)
+        problem_words = word_count(problem)
 
         candidates.append({
             "instance_id": row["instance_id"],
             "repo": repo,
-            "base_commit": row.get("base_commit", ""),
-            "python_version": row.get("environment_setup_commit", REPO_PYTHON.get(repo, "3.11")),
+            "base_commit": row["base_commit"],
+            "environment_setup_commit": row["environment_setup_commit"],
+            "python_version": repo_python[repo],
             "changed_file": changed_file,
             "patch_size": len(patch),
-            "problem_words": word_count(problem),
+            "problem_words": problem_words,
             "problem_statement": problem[:200] + "..." if len(problem) > 200 else problem,
             "fail_to_pass": fail_to_pass,
             "pass_to_pass": pass_to_pass[:3],  # truncate for display
             "patch": patch,
             "test_patch": test_patch[:500] + "..." if len(test_patch) > 500 else test_patch,
-            "hints_text": (row.get("hints_text", "") or "")[:100],
+            "hints_text": (row["hints_text"] or "")[:100],
         })
 
+    print(f"Total entries: {total}", file=sys.stderr)
+
     # Sort by patch size (simpler patches first)
     candidates.sort(key=lambda c: c["patch_size"])
 
@@ -147,11 +208,28 @@ def main():
             print(f"  Hints: {c['hints_text']}")
         print()
 
-    # Output JSON for easy consumption
-    json_file = "bench/swedebug/candidates.json"
-    with open(json_file, "w") as f:
-        json.dump(candidates, f, indent=2)
-    print(f"\nFull candidate list written to {json_file}", file=sys.stderr)
+    # Output JSON for easy consumption; the full row of any candidate can
+    # be fetched from the dataset by instance_id when it is needed
+    if args.include_patches:
+        output = candidates
+    else:
+        output = [{field: c[field] for field in SUMMARY_FIELDS} for c in candidates]
+
+    # One JSON object per line, so consumers can stream or grep records
+    json_file = "bench/swedebug/candidates.jsonl"
+    if orjson is not None:
+        with open(json_file, "wb") as f:
+            for c in output:
+                f.write(orjson.dumps(c) + b"\n")
+    else:
+        with open(json_file, "w") as f:
+            for c in output:
+                f.write(json.dumps(c) + "\n")
+    if args.include_patches:
+        print(f"\nFull candidate list written to {json_file}", file=sys.stderr)
+    else:
+        print(f"\nCandidate metadata written to {json_file} "
+              "(re-run with --include-patches for patches and problem text)", file=sys.stderr)
     print(f"\nPick 5 tasks and format them for tasks.json. Example:", file=sys.stderr)
     print("""
   {